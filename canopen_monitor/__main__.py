@@ -7,6 +7,9 @@ from .meta import Meta
 from .can import MagicCANBus, MessageTable
 from .parse import CANOpenParser, load_eds_files
 
+# Max number of messages pulled off of the bus per UI cycle
+BUS_BATCH_SIZE = 256
+
 
 def init_dirs():
     os.makedirs(CONFIG_DIR, exist_ok=True)
@@ -54,15 +57,16 @@ def main():
                 App(mt, eds_configs, bus, meta, features) as app:
             while True:
                 # Bus updates
-                for message in bus:
-                    if message is not None:
-                        mt += message
+                for message in bus.receive_batch(BUS_BATCH_SIZE):
+                    mt += message
 
                 # User Input updates
                 app.handle_keyboard_input()
 
-                # Draw update
-                app.draw(bus.statuses)
+                # Draw update, checked first since getting the interface
+                #   statuses is not free
+                if (app.should_draw()):
+                    app.draw(bus.statuses)
     except KeyboardInterrupt:
         print('Goodbye!')
 
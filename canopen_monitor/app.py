@@ -2,6 +2,7 @@ from __future__ import annotations
 import curses
 import curses.ascii
 import datetime as dt
+import time
 from easygui import fileopenbox
 from shutil import copy
 from enum import Enum
@@ -28,6 +29,11 @@ KEY_C_DOWN_UBUNTU = 525
 # Additional User Interface Related Constants
 VERTICAL_SCROLL_RATE = 16
 HORIZONTAL_SCROLL_RATE = 4
+MAX_FRAME_RATE = 30  # Max number of redraws per second
+
+# Pre-formatted standard (11-bit) COB IDs, since they get formatted on every
+#   draw of every row
+_PAD_HEX_11 = tuple(f'0x{i:03X}' for i in range(0x800))
 
 
 def pad_hex(value: int, pad: int = 3) -> str:
@@ -43,7 +49,9 @@ def pad_hex(value: int, pad: int = 3) -> str:
     :return: padded string
     :rtype: str
     """
-    return f'0x{hex(value).upper()[2:].rjust(pad, "0")}'
+    if pad == 3 and 0 <= value < 0x800:
+        return _PAD_HEX_11[value]
+    return f'0x{value:0{pad}X}'
 
 
 def trunc_timedelta(value: dt.timedelta, pad: int = 0):
@@ -133,6 +141,9 @@ class App:
         self.selected_pane = None
         self.meta = meta
         self.features = features
+        self._last_draw = 0
+        self._frame_interval = 1_000_000_000 // MAX_FRAME_RATE  # nanoseconds
+        self._force_draw = True
         self.key_dict = {
             KeyMap.UP_ARR.value['key']: self.up,
             KeyMap.S_UP_ARR.value['key']: self.shift_up,
@@ -169,6 +180,8 @@ class App:
         curses.noecho()  # disable user-input echo
         curses.curs_set(False)  # Disable the cursor
         self.__init_color_pairs()  # Enable colors and create pairs
+        self._color_ok = curses.color_pair(1)  # Interface status colors
+        self._color_err = curses.color_pair(3)
 
         # Don't initialize any grids, sub-panes, or windows until standard io
         #   screen has been initialized
@@ -321,6 +334,8 @@ class App:
         """
         self.hb_pane._reset_scroll_positions()
         self.misc_pane._reset_scroll_positions()
+        self.hb_pane._reset_shadow()
+        self.misc_pane._reset_shadow()
         self.screen.clear()
 
     def f1(self):
@@ -383,6 +398,11 @@ class App:
         keyboard_input = self.screen.getch()
         curses.flushinp()
 
+        # Any input may change what is on screen, so don't hold back the next
+        #   draw waiting on the frame budget
+        if keyboard_input != -1:
+            self._force_draw = True
+
         if self.add_if_win.enabled:
             if keyboard_input == curses.KEY_ENTER or \
                     keyboard_input == 10 or keyboard_input == 13:
@@ -452,7 +472,7 @@ class App:
 
         # Draw the interfaces
         for iface in ifaces:
-            color = curses.color_pair(1) if iface[1] else curses.color_pair(3)
+            color = self._color_ok if iface[1] else self._color_err
             sl = len(iface[0])
             self.screen.addstr(0, pos, iface[0], color)
             pos += sl + 1
@@ -467,14 +487,42 @@ class App:
                  '<F4>: Add Interface, <F5> Remove Interface'
         self.screen.addstr(height - 1, 1, footer)
 
-    def draw(self: App, ifaces: [tuple]) -> None:
+    def should_draw(self: App, forced: bool = False) -> bool:
+        """
+        Check whether a draw is due
+
+        Draws are capped at `MAX_FRAME_RATE` per second, any calls in between
+        are skipped unless forced or there was keyboard input since the last
+        draw. This lets the caller skip building the draw inputs as well.
+        :param forced: Draw regardless of the frame budget
+        :return: True if the next call to `draw()` would draw
+        """
+        return (forced
+                or self._force_draw
+                or time.monotonic_ns() - self._last_draw
+                >= self._frame_interval)
+
+    def draw(self: App, ifaces: [tuple], forced: bool = False) -> None:
         """
         Draw the entire interface
+
+        Draws are skipped while `should_draw()` is False.
         :param ifaces: CAN Bus Interfaces
+        :param forced: Draw regardless of the frame budget
         :return: None
         """
+        if (not self.should_draw(forced)):
+            return
+        self._last_draw = time.monotonic_ns()
+        self._force_draw = False
+
         window_active = any(popup.enabled for popup in self.popups)
         self.__draw_header(ifaces)  # Draw header info
+        self.__draw__footer()
+
+        # Stage the screen before the panes and windows, so that they get
+        #   layered on top of it
+        self.screen.noutrefresh()
 
         # Draw panes
         if (not window_active):
@@ -485,11 +533,13 @@ class App:
         for popup in self.popups:
             popup.draw()
 
-        self.__draw__footer()
+        # Send everything staged to the terminal at once
+        curses.doupdate()
 
     def refresh(self: App) -> None:
         """
         Refresh entire screen
         :return: None
         """
-        self.screen.refresh()
+        self.screen.noutrefresh()
+        curses.doupdate()
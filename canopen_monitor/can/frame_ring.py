@@ -0,0 +1,111 @@
+from __future__ import annotations
+import struct
+import multiprocessing as mp
+from multiprocessing.shared_memory import SharedMemory
+
+# Layout of a single slot: the raw CAN ID (including its flags), the DLC, the
+#   ID of the interface the frame was received on, the time the frame was
+#   received at and the data bytes
+_SLOT = struct.Struct('=IBxHd8s')
+
+
+class FrameRing:
+    """A fixed-size ring buffer of raw CAN frames in shared memory
+
+    This is meant to hand frames from a single producer process to a single
+    consumer process. Frames are packed into fixed-size slots, so no Python
+    objects cross the process boundary.
+
+    If the ring is full, new frames are dropped until the consumer catches up.
+
+    :param slots: Number of frames the ring can hold
+    :type slots: int
+
+    :param head: Total number of frames read from the ring
+    :type head: multiprocessing.Value
+
+    :param tail: Total number of frames written to the ring
+    :type tail: multiprocessing.Value
+    """
+
+    def __init__(self: FrameRing, slots: int):
+        self.slots = slots
+        self.shm = SharedMemory(create=True, size=slots * _SLOT.size)
+        self.head = mp.Value('Q', 0)
+        self.tail = mp.Value('Q', 0)
+
+    def __len__(self: FrameRing) -> int:
+        return self.tail.value - self.head.value
+
+    def put(self: FrameRing,
+            can_id: int,
+            dlc: int,
+            if_id: int,
+            timestamp: float,
+            data: bytes) -> bool:
+        """Writes a frame into the next free slot
+
+        .. warning::
+
+            This must only be called from the producer process
+
+        :param can_id: The CAN ID of the frame, including its flags
+        :type can_id: int
+
+        :param dlc: Number of data bytes in the frame
+        :type dlc: int
+
+        :param if_id: ID of the interface the frame was received on
+        :type if_id: int
+
+        :param timestamp: Time the frame was received at, in seconds since
+            the epoch
+        :type timestamp: float
+
+        :param data: The data bytes of the frame, up to 8
+        :type data: bytes
+
+        :return: `False` if the ring was full and the frame got dropped
+        :rtype: bool
+        """
+        tail = self.tail.value
+        if (tail - self.head.value >= self.slots):
+            return False
+        _SLOT.pack_into(self.shm.buf,
+                        (tail % self.slots) * _SLOT.size,
+                        can_id,
+                        dlc,
+                        if_id,
+                        timestamp,
+                        data)
+        self.tail.value = tail + 1
+        return True
+
+    def get_batch(self: FrameRing, n: int) -> [tuple]:
+        """Reads up to `n` frames out of the ring, oldest first
+
+        .. warning::
+
+            This must only be called from the consumer process
+
+        :param n: The maximum number of frames to read
+        :type n: int
+
+        :return: The CAN ID, DLC, interface ID, timestamp and data of each
+            frame read
+        :rtype: [tuple]
+        """
+        head = self.head.value
+        count = min(n, self.tail.value - head)
+        buf = self.shm.buf
+        slots = self.slots
+        unpack_from = _SLOT.unpack_from
+        batch = [unpack_from(buf, ((head + i) % slots) * _SLOT.size)
+                 for i in range(count)]
+        self.head.value = head + count
+        return batch
+
+    def close(self: FrameRing) -> None:
+        """Detaches from the shared memory and frees it"""
+        self.shm.close()
+        self.shm.unlink()
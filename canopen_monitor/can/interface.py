@@ -1,15 +1,68 @@
 from __future__ import annotations
 import psutil
 import socket
+import struct
 import datetime as dt
 from .message import Message
+from pyvit.can import FrameType
 from pyvit.hw.socketcan import SocketCanDev
 
 
 _SOCK_TIMEOUT = 0.1
+_SOCK_RCVBUF = 128
+
+# Layout of a raw SocketCAN `struct can_frame`: the CAN ID with its flags, the
+#   DLC, 3 bytes of padding and 8 bytes of data
+_CAN_FRAME = struct.Struct('=IB3x8s')
+_CAN_EFF_FLAG = 0x80000000  # Extended frame format
+_CAN_RTR_FLAG = 0x40000000  # Remote transmission request
+_CAN_ERR_FLAG = 0x20000000  # Error frame
+_CAN_SFF_MASK = 0x000007FF
+_CAN_EFF_MASK = 0x1FFFFFFF
 _STALE_INTERFACE = dt.timedelta(minutes=1)
 
 
+def frame_to_message(can_id: int,
+                     dlc: int,
+                     data: bytes,
+                     if_name: str,
+                     timestamp: dt.datetime) -> Message:
+    """Converts the fields of a raw SocketCAN frame into a Message
+
+    :param can_id: The CAN ID of the frame, including its flags
+    :type can_id: int
+
+    :param dlc: Number of data bytes in the frame
+    :type dlc: int
+
+    :param data: The data bytes of the frame
+    :type data: bytes
+
+    :param if_name: Name of the interface the frame was received on
+    :type if_name: str
+
+    :param timestamp: Time the frame was received at
+    :type timestamp: datetime.datetime
+
+    :return: The loaded message
+    :rtype: Message
+    """
+    extended = bool(can_id & _CAN_EFF_FLAG)
+    if (can_id & _CAN_ERR_FLAG):
+        frame_type = FrameType.ErrorFrame
+    elif (can_id & _CAN_RTR_FLAG):
+        frame_type = FrameType.RemoteFrame
+    else:
+        frame_type = FrameType.DataFrame
+
+    return Message(can_id & (_CAN_EFF_MASK if extended else _CAN_SFF_MASK),
+                   data=list(data[:dlc]),
+                   frame_type=frame_type,
+                   interface=if_name,
+                   timestamp=timestamp,
+                   extended=extended)
+
+
 class Interface(SocketCanDev):
     """This is a model of a POSIX interface
 
@@ -21,16 +74,28 @@ class Interface(SocketCanDev):
 
     :param last_activity: Timestamp of the last activity on the interface
     :type last_activity: datetime.datetime
+
+    :param rcvbuf: Size of the kernel receive buffer of the socket in bytes
+    :type rcvbuf: int
     """
 
-    def __init__(self: Interface, if_name: str):
+    def __init__(self: Interface,
+                 if_name: str,
+                 rcvbuf: int = _SOCK_RCVBUF):
         """Interface constructor
 
         :param if_name: The name of the interface to bind to
         :type if_name: str
+
+        :param rcvbuf: Size of the kernel receive buffer of the socket in
+            bytes. A small buffer makes the kernel drop frames rather than
+            queue them up when the monitor falls behind, keeping the displayed
+            frames close to live traffic. `None` keeps the system default.
+        :type rcvbuf: int
         """
         super().__init__(if_name)
         self.name = if_name
+        self.rcvbuf = rcvbuf
         self.last_activity = dt.datetime.now()
         self.socket.settimeout(_SOCK_TIMEOUT)
         self.listening = False
@@ -84,6 +149,10 @@ class Interface(SocketCanDev):
         while(block_wait and not self.is_up):
             pass
         super().start()
+        if(self.rcvbuf is not None):
+            self.socket.setsockopt(socket.SOL_SOCKET,
+                                   socket.SO_RCVBUF,
+                                   self.rcvbuf)
         self.listening = True
 
     def stop(self: Interface) -> None:
@@ -103,30 +172,47 @@ class Interface(SocketCanDev):
         self.stop()
         self.start(False)
 
+    def recv_raw(self: Interface) -> tuple:
+        """Reads a single raw SocketCAN frame off of the interface
+
+        :return: The CAN ID (including its flags), the DLC and the data bytes
+            of the frame if a frame is recieved within the configured
+            SOCKET_TIMEOUT, otherwise returns None
+        :rtype: tuple, None
+        """
+        try:
+            frame = _CAN_FRAME.unpack(self.socket.recv(_CAN_FRAME.size))
+        except OSError:
+            return None
+        except socket.timeout:
+            return None
+        self.last_activity = dt.datetime.now()
+        return frame
+
     def recv(self: Interface) -> Message:
-        """A wrapper for `pyvit.hw.SocketCanDev.recv()`
+        """A replacement for `pyvit.hw.SocketCanDev.recv()`
 
-        Instead of returning a `can.Frame`, it intercepts the `recv()` and
-        converts it to a `canopen_monitor.Message` at the last minute.
+        Instead of building a `can.Frame` and then converting it, it unpacks
+        the raw SocketCAN frame straight into a `canopen_monitor.Message`.
 
         :return: A loaded `canopen_monitor.Message` from the interface if a
             message is recieved within the configured SOCKET_TIMEOUT (default
             is 0.3 seconds), otherwise returns None
         :rtype: Message, None
         """
-        try:
-            frame = super().recv()
-            self.last_activity = dt.datetime.now()
-            return Message(frame.arb_id,
-                           data=list(frame.data),
-                           frame_type=frame.frame_type,
-                           interface=self.name,
-                           timestamp=dt.datetime.now(),
-                           extended=frame.is_extended_id)
-        except OSError:
-            return None
-        except socket.timeout:
+        frame = self.recv_raw()
+        if (frame is None):
             return None
+        return frame_to_message(*frame, self.name, self.last_activity)
+
+    def fileno(self: Interface) -> int:
+        """The file descriptor of the underlying socket, this allows an
+        `Interface` to be waited on with `select` and `selectors`
+
+        :return: File descriptor of the socket
+        :rtype: int
+        """
+        return self.socket.fileno()
 
     @property
     def is_up(self: Interface) -> bool:
@@ -1,24 +1,188 @@
 from __future__ import annotations
-from .interface import Interface
+from .interface import Interface, frame_to_message, _SOCK_RCVBUF, \
+    _SOCK_TIMEOUT
+from .frame_ring import FrameRing
 from .message import Message
-import queue
-import threading as t
+import datetime as dt
+import multiprocessing as mp
+import os
+import selectors
+import signal
+import time
+
+# Number of frames held between UI cycles, new frames get dropped if the UI
+#   falls behind the bus
+_FRAME_BUFFER_SIZE = 4096
+
+# Max time spent waiting for frames when the buffer is empty
+_IDLE_WAIT = 0.05
+
+
+def _update_listeners(selector: selectors.BaseSelector,
+                      wanted: {int: str},
+                      interfaces: {int: Interface},
+                      rcvbuf: int) -> None:
+    """Syncs the interfaces registered with the selector against the
+    interfaces the bus is managing
+
+    Interfaces that were removed or have gone down are unregistered and
+    stopped, interfaces that are up but not yet registered are (re)started
+    and registered.
+
+    :param selector: The selector the listener waits on
+    :type selector: selectors.BaseSelector
+
+    :param wanted: The names of the interfaces the bus is managing, by ID
+    :type wanted: dict
+
+    :param interfaces: The interfaces opened by the listener so far, by ID
+    :type interfaces: dict
+
+    :param rcvbuf: Size of the kernel receive buffer of each interface socket
+    :type rcvbuf: int
+    """
+    registered = selector.get_map()
+
+    for if_id, iface in list(interfaces.items()):
+        if ((if_id not in wanted or not iface.is_up)
+                and iface in registered):
+            selector.unregister(iface)
+            iface.stop()
+        if (if_id not in wanted):
+            iface.socket.close()
+            del interfaces[if_id]
+
+    for if_id, name in wanted.items():
+        if (if_id not in interfaces):
+            try:
+                interfaces[if_id] = Interface(name, rcvbuf)
+            except OSError:
+                continue
+        iface = interfaces[if_id]
+        if (iface not in registered and iface.is_up):
+            try:
+                iface.restart()
+                selector.register(iface, selectors.EVENT_READ, if_id)
+            except (OSError, ValueError):
+                pass
+
+
+def _listen(wanted: {int: str},
+            rcvbuf: int,
+            ring: FrameRing,
+            control: mp.connection.Connection,
+            keep_alive: mp.Event,
+            frames_ready: mp.Event) -> None:
+    """This is the entry point of the listener process, listening and
+    block-waiting for messages on all of the interfaces of the CAN bus at once
+
+    Frames are written into the shared frame ring as they are read. It will
+    operate on the condition that the Magic Can Bus is still active, and
+    takes interface changes over the control connection.
+
+    .. warning::
+
+            If for any reason, an interface cannot be listened to, (either
+            it doesn't exist or there are permission issues in reading from
+            it), then the default behavior is to stop listening to it,
+            wait for the interface to come back up, then resume.
+
+    :param wanted: The names of the interfaces to listen to, by ID
+    :type wanted: dict
+
+    :param rcvbuf: Size of the kernel receive buffer of each interface socket
+    :type rcvbuf: int
+
+    :param ring: The ring to write frames into
+    :type ring: FrameRing
+
+    :param control: Receiving end of the interface changes
+    :type control: multiprocessing.connection.Connection
+
+    :param keep_alive: Cleared by the bus when the listener should stop
+    :type keep_alive: multiprocessing.Event
+
+    :param frames_ready: Set by the listener when it has written frames
+    :type frames_ready: multiprocessing.Event
+    """
+    # Ctrl + C is handled by the parent, which then stops the listener
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    parent = os.getppid()
+
+    interfaces = {}
+    selector = selectors.DefaultSelector()
+    selector.register(control, selectors.EVENT_READ)
+    last_check = 0
+
+    while (keep_alive.is_set()):
+        # Interface recovery is checked on a timer instead of on every
+        #   frame, since checking the interface state is not free
+        now = time.monotonic()
+        if (now - last_check >= _SOCK_TIMEOUT):
+            if (os.getppid() != parent):
+                break
+            _update_listeners(selector, wanted, interfaces, rcvbuf)
+            last_check = now
+
+        # Only read from interfaces that are known to have a frame ready,
+        #   so the listener never blocks on a quiet interface
+        written = False
+        for key, _ in selector.select(timeout=_SOCK_TIMEOUT):
+            if (key.fileobj is control):
+                command, if_id, name = control.recv()
+                if (command == 'add'):
+                    wanted[if_id] = name
+                else:
+                    wanted.pop(if_id, None)
+                last_check = 0
+                continue
+
+            frame = key.fileobj.recv_raw()
+            if (frame is not None):
+                can_id, dlc, data = frame
+                written |= ring.put(can_id, dlc, key.data, time.time(), data)
+
+        if (written and not frames_ready.is_set()):
+            frames_ready.set()
+
+    for iface in interfaces.values():
+        iface.stop()
+        iface.socket.close()
+    selector.close()
 
 
 class MagicCANBus:
     """This is a macro-manager for multiple CAN interfaces
 
+    All of the interfaces are listened to by a single listener process, which
+    waits on the sockets of every interface at once and only reads from the
+    ones that have a frame ready. Frames are handed over through a ring
+    buffer in shared memory, so reading the bus never competes with the UI
+    for the GIL.
+
     :param interfaces: The list of serialized Interface objects the bus is
         managing
     :type interfaces: [Interface]
+
+    :param rcvbuf: Size of the kernel receive buffer of each interface socket,
+        `None` keeps the system default
+    :type rcvbuf: int
     """
 
-    def __init__(self: MagicCANBus, if_names: [str], no_block: bool = False):
-        self.interfaces = list(map(lambda x: Interface(x), if_names))
+    def __init__(self: MagicCANBus,
+                 if_names: [str],
+                 no_block: bool = False,
+                 rcvbuf: int = _SOCK_RCVBUF):
+        self.rcvbuf = rcvbuf
+        self.interfaces = list(map(lambda x: Interface(x, rcvbuf), if_names))
         self.no_block = no_block
-        self.keep_alive_list = dict()
-        self.message_queue = queue.SimpleQueue()
-        self.threads = []
+        self.keep_alive = mp.Event()
+        self.frames_ready = mp.Event()
+        self.listener = None
+        self.ring = None
+        self.__control = None
+        self.__if_ids = {}
+        self.__next_if_id = 0
 
     @property
     def statuses(self: MagicCANBus) -> [tuple]:
@@ -50,126 +214,160 @@ class MagicCANBus:
         if interface in interface_names:
             return
 
-        new_interface = Interface(interface)
+        new_interface = Interface(interface, self.rcvbuf)
         self.interfaces.append(new_interface)
-        self.threads.append(self.start_handler(new_interface))
+        self.__if_ids[self.__next_if_id] = new_interface
+        self.__send_control('add', self.__next_if_id, interface)
+        self.__next_if_id += 1
 
     def remove_interface(self: MagicCANBus, interface: str) -> None:
         """This will remove an interface at runtime
 
         :param interface: The name of the interface to remove
         :type interface: string"""
+        self.interfaces = list(filter(lambda x: str(x) != interface,
+                                      self.interfaces))
+        for if_id, iface in list(self.__if_ids.items()):
+            if str(iface) == interface:
+                del self.__if_ids[if_id]
+                self.__send_control('remove', if_id, interface)
 
-        # Check if interface is already existing
-        interface_names = self.interface_list
-        if interface not in interface_names:
-            return
+    def __send_control(self: MagicCANBus,
+                       command: str,
+                       if_id: int,
+                       name: str) -> None:
+        """Tells the listener process about an interface change, if it is
+        running
 
-        self.keep_alive_list[interface].clear()
-        for thread in self.threads:
-            if thread.name == f'canopen-monitor-{interface}':
-                thread.join()
-                self.threads.remove(thread)
-                del self.keep_alive_list[interface]
+        :param command: Either `add` or `remove`
+        :type command: str
 
-        for existing_interface in self.interfaces:
-            if str(existing_interface) == interface:
-                self.interfaces.remove(existing_interface)
+        :param if_id: ID of the interface
+        :type if_id: int
 
-    def start_handler(self: MagicCANBus, iface: Interface) -> t.Thread:
-        """This is a wrapper for starting a single interface listener thread
-            This wrapper also creates a keep alive event for each thread which
-            can be used to kill the thread.
+        :param name: Name of the interface
+        :type name: str
+        """
+        if (self.__control is not None):
+            self.__control.send((command, if_id, name))
 
-        .. warning::
+    def __enter__(self: MagicCANBus) -> MagicCANBus:
+        self.__if_ids = dict(enumerate(self.interfaces))
+        self.__next_if_id = len(self.interfaces)
+        wanted = {if_id: iface.name for if_id, iface in self.__if_ids.items()}
 
-                If for any reason, the interface cannot be listened to, (either
-                it doesn't exist or there are permission issues in reading from
-                it), then the default behavior is to stop listening for
-                messages, block wait for the interface to come back up, then
-                resume. It is possible that a thread starts but no listener
-                starts due to a failure to bind to the interface.
+        self.ring = FrameRing(_FRAME_BUFFER_SIZE)
+        control, self.__control = mp.Pipe(duplex=False)
+        self.keep_alive.set()
+        self.listener = mp.Process(target=_listen,
+                                   name='canopen-monitor-listener',
+                                   args=(wanted,
+                                         self.rcvbuf,
+                                         self.ring,
+                                         control,
+                                         self.keep_alive,
+                                         self.frames_ready),
+                                   daemon=True)
+        self.listener.start()
+        control.close()
+        return self
 
-        :param iface: The interface to bind to when listening for messages
-        :type iface: Interface
+    def __exit__(self: MagicCANBus,
+                 etype: str,
+                 evalue: str,
+                 traceback: any) -> None:
+        self.keep_alive.clear()
+        try:
+            if (self.no_block):
+                print('WARNING: Skipping wait-time for the listener to close'
+                      ' gracefully.')
+            elif (self.listener is not None):
+                print('Press <Ctrl + C> to quit without waiting.')
+                print(f'Waiting for listener {self.listener.name} to end... ',
+                      end='')
+                self.listener.join()
+                print('Done!')
+        finally:
+            # The shared memory outlives the process unless it is unlinked,
+            #   so this has to happen even if the wait gets interrupted
+            self.__control.close()
+            self.__control = None
+            self.ring.close()
+            self.ring = None
 
-        :return: The new listener thread spawned
-        :rtype: threading.Thread
-        """
-        self.keep_alive_list[iface.name] = t.Event()
-        self.keep_alive_list[iface.name].set()
+    def __to_messages(self: MagicCANBus, frames: [tuple]) -> [Message]:
+        """Converts raw frames read from the frame ring into messages
 
-        tr = t.Thread(target=self.handler,
-                      name=f'canopen-monitor-{iface.name}',
-                      args=[iface],
-                      daemon=True)
-        tr.start()
-        return tr
+        This also records the activity on the interfaces the frames were
+        received on.
 
-    def handler(self: MagicCANBus, iface: Interface) -> None:
-        """This is a handler for listening and block-waiting for messages on
-        the CAN bus
+        :param frames: The frames read from the frame ring
+        :type frames: [tuple]
 
-        It will operate on the condition that the Magic Can Bus is still
-        active, using thread-safe events.
+        :return: The loaded messages
+        :rtype: [Message]
+        """
+        if_ids = self.__if_ids
+        messages = []
+        for can_id, dlc, if_id, timestamp, data in frames:
+            iface = if_ids.get(if_id)
+            if (iface is None):
+                continue
+            iface.last_activity = dt.datetime.fromtimestamp(timestamp)
+            messages.append(frame_to_message(can_id,
+                                             dlc,
+                                             data,
+                                             iface.name,
+                                             iface.last_activity))
+        return messages
+
+    def receive(self: MagicCANBus) -> Message:
+        """Pops the oldest pending message off of the bus
 
-        :param iface: The interface to bind to when listening for messages
-        :type iface: Interface
+        :return: The oldest pending message or None if there are none
+        :rtype: Message, None
         """
+        if (self.ring is None):
+            return None
+        messages = self.__to_messages(self.ring.get_batch(1))
+        return messages[0] if messages else None
 
-        # The outer loop exists to enable interface recovery, if the interface
-        #   is either deleted or goes down, the handler will try to start it
-        #   again and read messages as soon as possible
-        while (self.keep_alive_list[iface.name].is_set()):
-            try:
-                # The inner loop is the constant reading of the bus and loading
-                #   of frames into a thread-safe queue. It is necessary to
-                #   check `iface.is_up` in the inner loop as well, so that the
-                #   handler will not block on bus reading if the MCB is trying
-                #   to close all threads and destruct itself
-                while (iface.is_up and iface.running and
-                       self.keep_alive_list[iface.name].is_set()):
-                    frame = iface.recv()
-                    if (frame is not None):
-                        self.message_queue.put(frame, block=True)
-                iface.restart()
-            except OSError:
-                pass
-        iface.stop()
+    def receive_batch(self: MagicCANBus, n: int) -> [Message]:
+        """Drains up to `n` pending messages off of the bus in one call
 
-    def __enter__(self: MagicCANBus) -> MagicCANBus:
-        self.threads = list(map(lambda x: self.start_handler(x),
-                                self.interfaces))
-        return self
+        If there are no pending messages, this waits briefly for the listener
+        process to signal new ones instead of returning immediately, so that
+        the caller does not spin on an idle bus.
 
-    def __exit__(self: MagicCANBus,
-                 etype: str,
-                 evalue: str,
-                 traceback: any) -> None:
-        for keep_alive in self.keep_alive_list.values():
-            keep_alive.clear()
-        if (self.no_block):
-            print('WARNING: Skipping wait-time for threads to close'
-                  ' gracefully.')
-        else:
-            print('Press <Ctrl + C> to quit without waiting.')
-            for tr in self.threads:
-                print(f'Waiting for thread {tr} to end... ', end='')
-                tr.join()
-                print('Done!')
+        :param n: The maximum number of messages to drain
+        :type n: int
+
+        :return: The drained messages, oldest first
+        :rtype: [Message]
+        """
+        ring = self.ring
+        if (ring is None):
+            return []
+        if (not len(ring)):
+            # Clear before waiting so that a frame written in-between still
+            #   sets the event and wakes this wait up
+            self.frames_ready.clear()
+            if (not len(ring)):
+                self.frames_ready.wait(_IDLE_WAIT)
+        return self.__to_messages(ring.get_batch(n))
 
     def __iter__(self: MagicCANBus) -> MagicCANBus:
         return self
 
     def __next__(self: MagicCANBus) -> Message:
-        if (self.message_queue.empty()):
+        message = self.receive()
+        if (message is None):
             raise StopIteration
-        return self.message_queue.get(block=True)
+        return message
 
     def __str__(self: MagicCANBus) -> str:
-        # Subtract 1 since the parent thread should not be counted
-        alive_threads = t.active_count() - 1
+        listening = self.listener is not None and self.listener.is_alive()
         if_list = ', '.join(list(map(lambda x: str(x), self.interfaces)))
         return f"Magic Can Bus: {if_list}," \
-               f" pending messages: {self.message_queue.qsize()}" \
-               f" threads: {alive_threads}"
+               f" pending messages: {len(self.ring or ())}" \
+               f" listener: {'running' if listening else 'stopped'}"
@@ -6,6 +6,10 @@ from pyvit.can import Frame
 STALE_TIME = dt.timedelta(seconds=5)
 DEAD_TIME = dt.timedelta(seconds=10)
 
+# The message type of every standard (11-bit) COB ID, filled in once the
+#   MessageType ranges are defined
+_COB_ID_TYPES = ()
+
 
 class MessageType(Enum):
     """This enumeration describes all of the ranges in the CANOpen spec that
@@ -99,6 +103,8 @@ class MessageType(Enum):
         :return: The message type (range) the COB ID fits into
         :rtype: MessageType
         """
+        if 0 <= cob_id < len(_COB_ID_TYPES):
+            return _COB_ID_TYPES[cob_id]
         for msg_type in list(MessageType):
             if msg_type.start <= cob_id <= msg_type.end:
                 return msg_type
@@ -108,6 +114,9 @@ class MessageType(Enum):
         return self.name
 
 
+_COB_ID_TYPES = tuple(map(MessageType.cob_id_to_type, range(0x800)))
+
+
 class MessageState(Enum):
     """This enumeration describes all possible states of a CAN Message
 
@@ -137,12 +146,20 @@ class Message(Frame):
 
     It's primary purpose is to carry all of the same CAN message data as a
     frame, while adding age and state attributes as well.
+
+    .. note::
+
+        The attributes added on top of `pyvit.can.Frame` are slotted, the
+        attributes of the frame itself still live in the instance dict since
+        `pyvit.can.Frame` does not define `__slots__`.
     """
+    __slots__ = ('node_name', 'message', 'error')
 
     def __init__(self: Message, arb_id: int, **kwargs):
         super().__init__(arb_id, **kwargs)
         self.node_name = 'N/A'
         self.message = self.data
+        self.error = ''
 
     @property
     def age(self: Message) -> dt.timedelta:
@@ -1,51 +1,113 @@
 from __future__ import annotations
 from .message import Message, MessageType
+from collections import defaultdict
+from sortedcontainers import SortedDict, SortedSet
 
 
 class MessageTable:
     def __init__(self: MessageTable, parser=None):
-        self.table = {}
+        self.table = SortedDict()
         self.parser = parser
 
+        # Incremented on every added message, so consumers can cheaply tell
+        #   whether the table changed since they last looked
+        self.generation = 0
+
+        # The sorted COB IDs of each type and supertype, messages are
+        #   classified once when their COB ID is first seen
+        self.__by_type = defaultdict(SortedSet)
+
+        # The sorted COB IDs matching each set of types filtered by, kept up
+        #   to date as new COB IDs show up. Updates to an existing COB ID don't
+        #   change the order
+        self.__filtered = {}
+
     def __add__(self: MessageTable, message: Message) -> MessageTable:
         if(self.parser is not None):
             message.node_name = self.parser.get_name(message)
             message.message, message.error = self.parser.parse(message)
+        if(message.arb_id not in self.table):
+            self.__classify(message)
         self.table[message.arb_id] = message
+        self.generation += 1
         return self
 
     def __len__(self: MessageTable) -> int:
         return len(self.table)
 
+    def __classify(self: MessageTable, message: Message) -> None:
+        """Adds the COB ID of a message to the buckets of its type and
+        supertype, as well as to every filtered set of types it falls into
+
+        :param message: The message being newly added to the table
+        :type message: Message
+        """
+        arb_id = message.arb_id
+        msg_type = message.type
+        msg_supertype = msg_type.supertype
+        self.__by_type[msg_type].add(arb_id)
+        self.__by_type[msg_supertype].add(arb_id)
+
+        for types, keys in self.__filtered.items():
+            if(msg_type in types or msg_supertype in types):
+                keys.add(arb_id)
+
+    def __filter_keys(self: MessageTable,
+                      types: [MessageType]) -> SortedSet:
+        """Gets the sorted COB IDs of all messages matching the given types,
+        building them from the type buckets the first time a set of types is
+        filtered by
+
+        :param types: The message types to match, either by type or supertype
+        :type types: [MessageType]
+
+        :return: The sorted COB IDs
+        :rtype: SortedSet
+        """
+        types = frozenset(types)
+        keys = self.__filtered.get(types)
+        if(keys is None):
+            keys = SortedSet()
+            for msg_type in types:
+                keys.update(self.__by_type.get(msg_type, ()))
+            self.__filtered[types] = keys
+        return keys
+
+    def count(self: MessageTable, types: [MessageType]) -> int:
+        """The number of messages matching the given types
+
+        :param types: The message types to match, either by type or supertype
+        :type types: [MessageType]
+
+        :return: Number of matching messages
+        :rtype: int
+        """
+        return len(self.__filter_keys(types))
+
     def filter(self: MessageTable,
                types: MessageType,
                start: int = 0,
                end: int = None,
                sort_by: str = 'arb_id',
                reverse=False) -> [Message]:
-        end = len(self.table) if end is None else end
-        messages = list(filter(lambda x: x.type in types
-                        or x.supertype in types, self.table.values()))
-        slice = messages[start:end]
-        return sorted(slice, key=lambda x: getattr(x, sort_by), reverse=reverse)
+        if(sort_by != 'arb_id'):
+            messages = sorted(map(self.table.get, self.__filter_keys(types)),
+                              key=lambda x: getattr(x, sort_by),
+                              reverse=reverse)
+            return messages[start:end]
+
+        keys = self.__filter_keys(types)
+        if(reverse):
+            keys = keys[::-1]
+        return list(map(self.table.get, keys[start:end]))
 
     def __contains__(self: MessageTable, node_id: int) -> bool:
         return node_id in self.table
 
-    def __iter__(self: MessageTable) -> MessageTable:
-        self.__keys = sorted(list(self.table.keys()))
-        return self
-
-    def __next__(self: MessageTable) -> Message:
-        if(self.__start == self.__stop):
-            raise StopIteration()
-        message = self.table[self.__keys[self.__start]]
-        self.__start += 1
-        return message
+    def __iter__(self: MessageTable) -> iter:
+        return iter(self.table.values())
 
     def __call__(self: MessageTable,
                  start: int,
-                 stop: int = None) -> MessageTable:
-        self.__stop = stop if stop < len(self.table) else len(self.table)
-        self.__start = start if start < self.__stop else self.__stop
-        return self
+                 stop: int = None) -> [Message]:
+        return self.table.values()[start:stop]
@@ -1,4 +1,5 @@
 from __future__ import annotations
+from operator import attrgetter
 
 
 class Column:
@@ -9,24 +10,36 @@ class Column:
                  padding: int = 2):
         self.name = name
         self.attr_name = attr_name
+        self.getter = attrgetter(attr_name)
         self.fmt_fn = fmt_fn
         self.padding = padding
+        self.spacer = ' ' * self.padding
         self.length = len(name) + self.padding
 
-    def update_length(self: Column, object: any) -> bool:
-        obj_len = len(self.fmt_fn(getattr(object, self.attr_name))) \
-                  + self.padding
+    def text(self: Column, object: any) -> str:
+        return self.fmt_fn(self.getter(object))
+
+    def fit(self: Column, text: str) -> bool:
+        text_len = len(text) + self.padding
 
-        if(obj_len > self.length):
-            self.length = obj_len
+        if(text_len > self.length):
+            self.length = text_len
             return True
         return False
 
+    def update_length(self: Column, object: any) -> bool:
+        return self.fit(self.text(object))
+
     @property
     def header(self: Column) -> str:
-        return f'{self.name}{(" " * self.padding)}'.ljust(self.length, ' ')
+        return self.pad(self.name)
+
+    def pad(self: Column, text: str) -> str:
+        # Text that already fits the column only needs to be left-justified,
+        #   the padding is then part of the justified space
+        if(len(text) + self.padding <= self.length):
+            return text.ljust(self.length)
+        return text + self.spacer
 
     def format(self: Column, object: any) -> str:
-        return f'{self.fmt_fn(getattr(object, self.attr_name))}' \
-               f'{(" " * self.padding)}' \
-               .ljust(self.length, ' ')
+        return self.pad(self.text(object))
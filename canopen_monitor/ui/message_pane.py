@@ -1,8 +1,9 @@
 from __future__ import annotations
 from .pane import Pane
 from .colum import Column
-from ..can import Message, MessageType, MessageTable
+from ..can import MessageType, MessageTable
 import curses
+import time
 
 
 class MessagePane(Pane):
@@ -44,12 +45,18 @@ class MessagePane(Pane):
         # Pane details
         self._name = name
         self.cols = cols
+        self._total_col_width = sum(col.length for col in self.cols)
         self.types = types
         self.__top = 0
         self.__top_max = 0
         self.__header_style = curses.color_pair(4)
         self.table = message_table
 
+        # Damage tracking: the text and style last written to each cell and a
+        #   snapshot of everything the previous draw depended on
+        self._shadow = {}
+        self.__last_draw = None
+
         # Cursor stuff
         self.cursor = 0
         self.cursor_min = 0
@@ -68,9 +75,13 @@ class MessagePane(Pane):
         :param width: New virtual width
         :type width: int
         """
+        prev_dimensions = (self.d_height, self.d_width)
         super().resize(height, width)
+        if((self.d_height, self.d_width) != prev_dimensions):
+            self._reset_shadow()
+
         p_height = self.d_height - 3
-        table_size = len(self.table.filter(self.types))
+        table_size = self.table.count(self.types)
         occluded = table_size - self.__top - self.d_height + 3
 
         self.cursor_max = table_size if table_size < p_height else p_height
@@ -86,6 +97,49 @@ class MessagePane(Pane):
         self.scroll_position_y = 0
         self.scroll_position_x = 0
 
+    def _reset_shadow(self: MessagePane) -> None:
+        """
+        Forget what was last written to the Pane, forcing the next draw to
+        rewrite every cell.
+        """
+        self._shadow.clear()
+        self.__last_draw = None
+
+    def _render_cell(self: MessagePane,
+                     y: int,
+                     x: int,
+                     text: str,
+                     highlight: bool = False,
+                     color: any = None) -> None:
+        """
+        A wrapper for `Pane.add_line()` that skips the write entirely if the
+        cell already holds the same text in the same style.
+
+        :param y: Cell's row position
+        :type y: int
+
+        :param x: Cell's collumn position
+        :type x: int
+
+        :param text: Text to write to the cell
+        :type text: str
+
+        :param highlight: A syle option to highlight the text
+        :type highlight: bool
+
+        :param color: A color option for the text
+        :type color: curses.style
+        """
+        cell = (text, highlight, color)
+        if(self._shadow.get((y, x)) == cell):
+            return
+
+        self.add_line(text, y=y, x=x, highlight=highlight, color=color)
+
+        # Rows past the drawn height are not written by `add_line()`
+        if(y < self.d_height):
+            self._shadow[(y, x)] = cell
+
     @property
     def scroll_limit_y(self: MessagePane) -> int:
         """
@@ -98,9 +152,7 @@ class MessagePane(Pane):
         """
         The maximim columns the pad is allowed to shift by when scrolling
         """
-        max_length = sum(list(map(lambda x: x.length, self.cols)))
-        occluded = max_length - self.d_width + 7
-        return occluded if(occluded > 0) else 0
+        return max(0, self._total_col_width - self.d_width + 7)
 
     def scroll_up(self: MessagePane, rate: int = 1) -> None:
         """
@@ -111,50 +163,29 @@ class MessagePane(Pane):
         :param rate: Number of messages to scroll by
         :type rate: int
         """
-        # Record current cursor info for later scroll calculations
-        prev = self.cursor
-        min = 0
-
-        # Move the cursor
-        self.cursor -= rate
-
-        # If the cursor is less than the minimum, reset it to the minimum then
-        #   do calculations for shifting the message table
-        if(self.cursor < self.cursor_min):
-            self.cursor = self.cursor_min
-
-            # Deduct the amount of cursor movement from the message table
-            #   movement and reset shift to bounds if need be
-            leftover = rate - prev
-            self.__top -= leftover
-            self.__top = min if(self.__top < min) else self.__top
+        # Move the cursor up to the top of the pane, and shift the message
+        #   table by whatever movement the cursor could not take
+        target = self.cursor - rate
+        overflow = max(0, self.cursor_min - target)
+        self.cursor = max(self.cursor_min, target)
+        self.__top = max(0, self.__top - overflow)
 
     def scroll_down(self: MessagePane, rate: int = 1) -> None:
         """
-        This overrides `Pane.scroll_up()`. Instead of shifting the
+        This overrides `Pane.scroll_down()`. Instead of shifting the
         pad vertically, the slice of messages from the `MessageTable` is
         shifted.
 
         :param rate: Number of messages to scroll by
         :type rate: int
         """
-        # Record current cursor info for later scroll calculations
-        prev = self.cursor
-        max = self.__top + self.__top_max
-
-        # Move the cursor
-        self.cursor += rate
-
-        # If the cursor is greater than the maximum, reset it to the minimum
-        #   then do calculations for shifting the message table
-        if(self.cursor > (self.cursor_max - 1)):
-            self.cursor = self.cursor_max - 1
-
-            # Deduct the amount of cursor movement from the message table
-            #   movement and reset shift to bounds if need be
-            leftover = rate - (self.cursor - prev)
-            self.__top += leftover
-            self.__top = max if(self.__top > max) else self.__top
+        # Move the cursor down to the bottom of the pane, and shift the
+        #   message table by whatever movement the cursor could not take
+        target = self.cursor + rate
+        last = self.cursor_max - 1
+        overflow = max(0, target - last)
+        self.cursor = max(self.cursor_min, min(last, target))
+        self.__top = min(self.__top + self.__top_max, self.__top + overflow)
 
     def __draw_header(self: Pane) -> None:
         """
@@ -162,47 +193,79 @@ class MessagePane(Pane):
 
         This uses the `cols` dictionary to determine what to write
         """
+        # The title sits on the border, which gets redrawn on every draw, so
+        #   it is always written
         self.add_line(f'{self._name}:'
-                      f' ({len(self.table.filter(self.types))} messages)',
+                      f' ({self.table.count(self.types)} messages)',
                       y=0,
                       x=1,
                       highlight=self.selected)
-        self._pad.move(1, 1)
-        for col in self.cols:
-            self.add_line(col.header,
+        self._render_cell(1,
+                          1,
+                          ''.join(col.header for col in self.cols),
                           highlight=True,
-                          color=curses.color_pair(4))
+                          color=self.__header_style)
 
     def draw(self: MessagePane) -> None:
         """
         Draw all records from the MessageTable to the Pane
         """
-        super().draw()
         self.resize(self.v_height, self.v_width)
 
+        # Skip straight to the refresh if nothing the draw depends on has
+        #   changed, the age and state of messages are time based so the
+        #   current second is part of that as well
+        snapshot = (self.table.generation,
+                    int(time.monotonic()),
+                    self.__top,
+                    self.cursor,
+                    self.selected,
+                    self.d_height,
+                    self.d_width)
+        if(snapshot == self.__last_draw):
+            super().refresh()
+            return
+
         # Get the messages to be displayed based on scroll positioning,
-        #   and adjust column widths accordingly
-        draw_messages = self.table.filter(self.types, self.__top, self.__top + self.d_height - 3)
-        self.__check_col_widths(draw_messages)
+        #   format them once and adjust column widths accordingly. This may
+        #   clear the pad, so it has to happen before the border is drawn
+        draw_messages = self.table.filter(self.types,
+                                          self.__top,
+                                          self.__top + self.d_height - 3)
+        rows = [[col.text(message) for col in self.cols]
+                for message in draw_messages]
+        self.__check_col_widths(rows)
+        super().draw()
 
         # Draw the header and messages
         self.__draw_header()
-        for i, message in enumerate(draw_messages):
-            self._pad.move(2 + i, 1)
-            for col in self.cols:
-                self.add_line(col.format(message),
+        for i, row in enumerate(rows):
+            line = ''.join(col.pad(text) for col, text in zip(self.cols, row))
+            self._render_cell(2 + i,
+                              1,
+                              line,
                               highlight=((self.cursor == i) and self.selected))
+
         # Refresh the Pane and end the draw cycle
+        self.__last_draw = snapshot
         super().refresh()
 
-    def __check_col_widths(self: MessagePane, messages: [Message]) -> None:
+    def __check_col_widths(self: MessagePane, rows: [[str]]) -> None:
         """
         Check the width of the message in Pane column.
 
-        :param messages: The list of the messages
-        :type messages: list
+        The pad is cleared at most once, and only if any column had to grow.
+
+        :param rows: The formatted text of each column of each message
+        :type rows: list
         """
-        for col in self.cols:
-            for message in messages:
-                if(col.update_length(message)):
-                    self._pad.clear()
+        grew = False
+        for col, texts in zip(self.cols, zip(*rows)):
+            prev_length = col.length
+            if(col.fit(max(texts, key=len))):
+                self._total_col_width += col.length - prev_length
+                grew = True
+
+        if(grew):
+            self._pad.clear()
+            self._reset_shadow()
@@ -85,6 +85,7 @@ class Pane(ABC):
         draw should first resize the pad using: `super().resize(w, h)`
         then add content using: self._pad.addstr()
         then refresh using: `super().refresh()`
+        and the owner of the screen flushes it using: `curses.doupdate()`
 
         abstract method will clear and handle border
 
@@ -156,13 +157,22 @@ class Pane(ABC):
     def refresh(self: Pane) -> None:
         """
         Refresh the pane based on configured draw dimensions
+
+        This only stages the pane in the virtual screen, nothing is sent to
+        the terminal until the next `curses.doupdate()`.
+
+        The whole pad is marked as changed first, so that anything drawn over
+        the pane since the last refresh (popups, screen clears) gets
+        repainted. Curses still only sends the cells that actually differ
+        from the terminal.
         """
-        self._pad.refresh(self.scroll_position_y,
-                          self.scroll_position_x,
-                          self.y,
-                          self.x,
-                          self.y + self.d_height,
-                          self.x + self.d_width)
+        self._pad.touchwin()
+        self._pad.noutrefresh(self.scroll_position_y,
+                              self.scroll_position_x,
+                              self.y,
+                              self.x,
+                              self.y + self.d_height,
+                              self.x + self.d_width)
         self.needs_refresh = False
 
     def scroll_up(self: Pane, rate: int = 1) -> bool:
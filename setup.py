@@ -36,6 +36,7 @@ setuptools.setup(
         "psutil >= 5.8.0",
         "python-dateutil >= 2.8.1",
         "easygui >= 0.98.2",
+        "sortedcontainers >= 2.4.0",
     ],
     extras_require={
         "dev": [
@@ -0,0 +1,41 @@
+import unittest
+from canopen_monitor.app import pad_hex
+
+
+def old_pad_hex(value: int, pad: int = 3) -> str:
+    # The implementation pad_hex() replaced, kept as the reference output
+    return f'0x{hex(value).upper()[2:].rjust(pad, "0")}'
+
+
+class PadHex_Spec(unittest.TestCase):
+    """Tests for the pad_hex formatter"""
+
+    def test_standard_ids(self):
+        """Given standard 11-bit COB IDs and the default padding
+        When formatting them with pad_hex()
+        Then the pre-formatted strings should match the old output
+        """
+        for value in [0x000, 0x001, 0x181, 0x7FF]:
+            self.assertEqual(pad_hex(value), old_pad_hex(value))
+        self.assertEqual(pad_hex(0x000), '0x000')
+        self.assertEqual(pad_hex(0x7FF), '0x7FF')
+
+    def test_other_ids(self):
+        """Given COB IDs past the standard range
+        When formatting them with pad_hex()
+        Then the formatted strings should match the old output
+        """
+        for value in [0x800, 0x1234, 0x1FFFFFFF]:
+            self.assertEqual(pad_hex(value), old_pad_hex(value))
+        self.assertEqual(pad_hex(0x800), '0x800')
+        self.assertEqual(pad_hex(0x1FFFFFFF), '0x1FFFFFFF')
+
+    def test_other_padding(self):
+        """Given COB IDs and a padding other than the default
+        When formatting them with pad_hex()
+        Then the formatted strings should match the old output
+        """
+        for pad in [0, 1, 8]:
+            for value in [0x000, 0x07F, 0x7FF, 0x1FFFFFFF]:
+                self.assertEqual(pad_hex(value, pad), old_pad_hex(value, pad))
+        self.assertEqual(pad_hex(0x7F, 8), '0x0000007F')
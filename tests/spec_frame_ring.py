@@ -0,0 +1,50 @@
+import unittest
+from canopen_monitor.can.frame_ring import FrameRing
+
+
+class FrameRing_Spec(unittest.TestCase):
+    """Tests for the Frame Ring"""
+
+    def setUp(self):
+        self.ring = FrameRing(4)
+
+    def tearDown(self):
+        self.ring.close()
+
+    def test_put_get(self):
+        """Given an empty frame ring
+        When putting a frame in and then reading a batch
+        Then the same frame should be read back and the ring should be empty
+        """
+        self.assertTrue(self.ring.put(0x701, 1, 2, 1.5, b'\x05'))
+        self.assertEqual(len(self.ring), 1)
+        self.assertEqual(self.ring.get_batch(8),
+                         [(0x701, 1, 2, 1.5, b'\x05' + bytes(7))])
+        self.assertEqual(len(self.ring), 0)
+        self.assertEqual(self.ring.get_batch(8), [])
+
+    def test_wrap_around(self):
+        """Given a frame ring that has been filled and drained once
+        When putting more frames in than fit in the rest of the buffer
+        Then the frames should be read back oldest first
+        """
+        for cob_id in range(4):
+            self.ring.put(cob_id, 0, 0, 0.0, b'')
+        self.ring.get_batch(3)
+        for cob_id in range(4, 7):
+            self.ring.put(cob_id, 0, 0, 0.0, b'')
+
+        batch = self.ring.get_batch(8)
+        self.assertEqual([frame[0] for frame in batch], [3, 4, 5, 6])
+
+    def test_full(self):
+        """Given a full frame ring
+        When putting another frame in
+        Then the new frame should be dropped and the old frames kept
+        """
+        for cob_id in range(4):
+            self.assertTrue(self.ring.put(cob_id, 0, 0, 0.0, b''))
+        self.assertFalse(self.ring.put(4, 0, 0, 0.0, b''))
+
+        batch = self.ring.get_batch(8)
+        self.assertEqual([frame[0] for frame in batch], [0, 1, 2, 3])
@@ -1,5 +1,9 @@
+import socket
 import unittest
+import datetime as dt
 from canopen_monitor import can
+from canopen_monitor.can.interface import frame_to_message
+from pyvit.can import FrameType
 from unittest.mock import MagicMock, patch
 
 
@@ -31,3 +35,103 @@ class Interface_Spec(unittest.TestCase):
         with self.iface as iface:
             self.assertTrue(iface.is_up)
         self.assertFalse(iface.is_up)
+
+
+class Interface_Rcvbuf_Spec(unittest.TestCase):
+    """Tests for the receive buffer size of the Interface socket"""
+
+    def make_interface(self, **kwargs):
+        # Creating a real CAN socket requires SocketCAN support, so the socket
+        #   itself is faked
+        with patch('socket.socket') as fake_socket:
+            iface = can.Interface('vcan0', **kwargs)
+        self.assertIs(iface.socket, fake_socket.return_value)
+        return iface
+
+    def test_default_rcvbuf(self):
+        """Given an Interface with the default receive buffer size
+        When starting the interface
+        Then the receive buffer of the socket should be shrunk to 128 bytes
+        """
+        iface = self.make_interface()
+        iface.start(False)
+        iface.socket.setsockopt.assert_called_once_with(socket.SOL_SOCKET,
+                                                        socket.SO_RCVBUF,
+                                                        128)
+
+    def test_no_rcvbuf(self):
+        """Given an Interface with no receive buffer size
+        When starting the interface
+        Then the receive buffer of the socket should be left as the system
+        default
+        """
+        iface = self.make_interface(rcvbuf=None)
+        iface.start(False)
+        iface.socket.setsockopt.assert_not_called()
+
+
+class FrameToMessage_Spec(unittest.TestCase):
+    """Tests for decoding raw SocketCAN frames into Messages"""
+
+    def setUp(self):
+        self.timestamp = dt.datetime.now()
+
+    def test_standard_frame(self):
+        """Given a raw standard data frame
+        When converting it into a message
+        Then the message should keep its COB ID, data, interface and
+        timestamp and not be marked as extended
+        """
+        message = frame_to_message(0x701,
+                                   1,
+                                   b'\x05' + bytes(7),
+                                   'vcan0',
+                                   self.timestamp)
+        self.assertEqual(message.arb_id, 0x701)
+        self.assertFalse(message.is_extended_id)
+        self.assertEqual(message.frame_type, FrameType.DataFrame)
+        self.assertEqual(message.data, [0x05])
+        self.assertEqual(message.interface, 'vcan0')
+        self.assertEqual(message.timestamp, self.timestamp)
+
+    def test_extended_frame(self):
+        """Given a raw frame with the extended frame format flag set
+        When converting it into a message
+        Then the flag should be masked off the COB ID and the message should
+        be marked as extended
+        """
+        message = frame_to_message(0x80001234,
+                                   0,
+                                   bytes(8),
+                                   'vcan0',
+                                   self.timestamp)
+        self.assertEqual(message.arb_id, 0x1234)
+        self.assertTrue(message.is_extended_id)
+        self.assertEqual(message.frame_type, FrameType.DataFrame)
+
+    def test_remote_frame(self):
+        """Given a raw frame with the remote transmission request flag set
+        When converting it into a message
+        Then the flag should be masked off the COB ID and the message should
+        be a remote frame
+        """
+        message = frame_to_message(0x40000701,
+                                   0,
+                                   bytes(8),
+                                   'vcan0',
+                                   self.timestamp)
+        self.assertEqual(message.arb_id, 0x701)
+        self.assertFalse(message.is_extended_id)
+        self.assertEqual(message.frame_type, FrameType.RemoteFrame)
+
+    def test_dlc_truncation(self):
+        """Given a raw frame with a DLC shorter than its 8 byte data field
+        When converting it into a message
+        Then only the first DLC bytes should be kept as the message data
+        """
+        message = frame_to_message(0x181,
+                                   3,
+                                   bytes(range(1, 9)),
+                                   'vcan0',
+                                   self.timestamp)
+        self.assertEqual(message.data, [1, 2, 3])
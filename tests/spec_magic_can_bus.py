@@ -1,33 +1,54 @@
+import time
+import socket
 import unittest
 import threading
+import multiprocessing as mp
 from canopen_monitor import can
-from unittest.mock import MagicMock
+from multiprocessing.shared_memory import SharedMemory
+from unittest.mock import MagicMock, patch
+
+
+def fork_listener():
+    """Patches the bus to always fork its listener, since the fakes used by
+    these tests cannot be pickled for any other start method"""
+    return patch('canopen_monitor.can.magic_can_bus.mp',
+                 mp.get_context('fork'))
 
 
 class MagicCanBus_Spec(unittest.TestCase):
     """Tests for the Magic Can Bus"""
 
     def setUp(self):
-        # Fake CAN frame
-        generic_frame = MagicMock()
+        # Fake raw CAN frame
+        generic_frame = (0x701, 1, b'\x05' + bytes(7))
+
+        # Fake sockets, the first one always has data pending
+        self.sockets = socket.socketpair()
+        self.sockets[1].send(b'frame')
 
         # Create fake interfaces
         if0 = MagicMock()
         if0.name = 'vcan0'
         if0.is_up = True
-        if0.recv.return_value = generic_frame
+        if0.recv_raw.return_value = generic_frame
+        if0.fileno.return_value = self.sockets[0].fileno()
         if0.__str__.return_value = 'vcan0'
 
         if1 = MagicMock()
         if1.name = 'vcan1'
         if1.is_up = False
-        if1.recv.return_value = generic_frame
+        if1.recv_raw.return_value = generic_frame
+        if1.fileno.return_value = self.sockets[1].fileno()
         if1.__str__.return_value = 'vcan1'
 
         # Setup the bus with no interfaces and then overide with the fakes
         self.bus = can.MagicCANBus([])
         self.bus.interfaces = [if0, if1]
 
+    def tearDown(self):
+        for sock in self.sockets:
+            sock.close()
+
     def test_statuses(self):
         """Given an MCB with 2 fake interfaces
         When calling the statuses proprty
@@ -38,17 +59,52 @@ class MagicCanBus_Spec(unittest.TestCase):
 
     def test_handler(self):
         """Given an MCB with 2 interfaces
-        When starting the bus listeners with a `with` block
+        When starting the bus listener with a `with` block
         And calling the bus as an itterable
-        Then the bus should start a separate thread and fill the queue with
-        frames while the bus is open and then close the threads when the bus is
-        closed
+        Then the bus should start a single separate process that only reads
+        from the interface that is up and fill the ring with frames while the
+        bus is open and then end the process when the bus is closed
         """
-        with self.bus as bus:
-            for frame in bus:
-                self.assertIsNotNone(frame)
-        # Active threads should only be 1 by the end, 1 being the parent
+        fakes = {str(iface): iface for iface in self.bus.interfaces}
+        with fork_listener(), \
+             patch('canopen_monitor.can.magic_can_bus.Interface',
+                   side_effect=lambda name, rcvbuf: fakes[name]):
+            with self.bus as bus:
+                self.assertTrue(bus.listener.is_alive())
+                self.assertIn('listener: running', str(bus))
+                deadline = time.monotonic() + 5
+                messages = []
+                while (not messages):
+                    self.assertLess(time.monotonic(),
+                                    deadline,
+                                    'No frames received from the listener')
+                    messages = bus.receive_batch(1)
+                messages += list(bus)
+
+        self.assertFalse(self.bus.listener.is_alive())
         self.assertEqual(threading.active_count(), 1)
+        for message in messages:
+            self.assertEqual(message.arb_id, 0x701)
+            self.assertEqual(message.data, [0x05])
+            self.assertEqual(message.interface, 'vcan0')
+
+    def test_interrupted_exit(self):
+        """Given an open MCB
+        When the wait for the listener to end gets interrupted by Ctrl + C
+        Then the interrupt should propagate and the frame ring should still
+        be released
+        """
+        with fork_listener(), \
+             patch('canopen_monitor.can.magic_can_bus._listen'):
+            with self.assertRaises(KeyboardInterrupt):
+                with self.bus as bus:
+                    ring = bus.ring
+                    bus.listener.join = MagicMock(
+                        side_effect=KeyboardInterrupt)
+
+        self.assertIsNone(self.bus.ring)
+        with self.assertRaises(FileNotFoundError):
+            SharedMemory(ring.shm.name)
 
     def test_str(self):
         """Given an MCB with 2 interfaces
@@ -57,6 +113,44 @@ class MagicCanBus_Spec(unittest.TestCase):
         of the bus
         """
         expected = 'Magic Can Bus: vcan0, vcan1, pending messages:' \
-                   ' 0 threads: 0'
+                   ' 0 listener: stopped'
         actual = str(self.bus)
         self.assertEqual(expected, actual)
+
+    def test_receive(self):
+        """Given an MCB with 2 pending frames
+        When calling receive() three times
+        Then the frames should be returned oldest first as messages from the
+        interface they were received on and then None once the bus is drained
+        """
+        with fork_listener(), \
+             patch('canopen_monitor.can.magic_can_bus._listen'):
+            with self.bus as bus:
+                bus.ring.put(0x701, 1, 0, time.time(), b'\x05')
+                bus.ring.put(0x702, 1, 1, time.time(), b'\x7f')
+
+                message = bus.receive()
+                self.assertEqual(message.arb_id, 0x701)
+                self.assertEqual(message.interface, 'vcan0')
+                message = bus.receive()
+                self.assertEqual(message.arb_id, 0x702)
+                self.assertEqual(message.interface, 'vcan1')
+                self.assertIsNone(bus.receive())
+
+    def test_receive_batch(self):
+        """Given an MCB with 3 pending frames
+        When calling receive_batch() with a batch size of 2
+        Then the 2 oldest frames should be returned and the last frame
+        should remain pending
+        """
+        with fork_listener(), \
+             patch('canopen_monitor.can.magic_can_bus._listen'):
+            with self.bus as bus:
+                for cob_id in [0x701, 0x702, 0x703]:
+                    bus.ring.put(cob_id, 1, 0, time.time(), b'\x05')
+
+                batch = bus.receive_batch(2)
+                self.assertEqual([m.arb_id for m in batch], [0x701, 0x702])
+                batch = bus.receive_batch(2)
+                self.assertEqual([m.arb_id for m in batch], [0x703])
+                self.assertEqual(bus.receive_batch(2), [])
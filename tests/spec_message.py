@@ -0,0 +1,29 @@
+import unittest
+from canopen_monitor.can import MessageType
+
+
+class MessageType_Spec(unittest.TestCase):
+    """Tests for the Message Type"""
+
+    def test_cob_id_to_type(self):
+        """Given COB IDs from across the CANOpen ranges
+        When determining their message types
+        Then the most specific type of each range should be returned
+        """
+        expected = {
+            0x000: MessageType.NMT,
+            0x07F: MessageType.SYNC,
+            0x081: MessageType.EMER,
+            0x100: MessageType.TIME,
+            0x181: MessageType.PDO1_TX,
+            0x57F: MessageType.PDO4_RX,
+            0x5A1: MessageType.SDO_TX,
+            0x680: MessageType.SDO_RX,
+            0x681: MessageType.UKNOWN,
+            0x721: MessageType.HEARTBEAT,
+            0x800: MessageType.UKNOWN,
+            0x1ABCDEF0: MessageType.UKNOWN,
+        }
+        for cob_id, msg_type in expected.items():
+            self.assertEqual(MessageType.cob_id_to_type(cob_id), msg_type,
+                             hex(cob_id))
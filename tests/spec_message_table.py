@@ -0,0 +1,78 @@
+import unittest
+import datetime as dt
+from canopen_monitor.can import Message, MessageTable, MessageType
+
+
+def make_message(arb_id: int, data: [int] = [0]) -> Message:
+    return Message(arb_id, data=data, timestamp=dt.datetime.now())
+
+
+class MessageTable_Spec(unittest.TestCase):
+    """Tests for the Message Table"""
+
+    def setUp(self):
+        self.table = MessageTable()
+        for arb_id in [0x721, 0x181, 0x701, 0x581]:
+            self.table += make_message(arb_id)
+
+    def test_filter_sorted(self):
+        """Given a table with heartbeat, PDO and SDO messages
+        When filtering by heartbeat and PDO types
+        Then only the matching messages should be returned, sorted by COB ID
+        """
+        messages = self.table.filter([MessageType.HEARTBEAT, MessageType.PDO])
+        self.assertEqual([m.arb_id for m in messages], [0x181, 0x701, 0x721])
+
+    def test_filter_slice(self):
+        """Given a table with 2 heartbeat messages
+        When filtering a slice of heartbeat messages
+        Then the slice should be taken from the sorted messages
+        """
+        messages = self.table.filter([MessageType.HEARTBEAT], 1, 2)
+        self.assertEqual([m.arb_id for m in messages], [0x721])
+
+    def test_filter_new_message(self):
+        """Given a table that has already been filtered
+        When a message with a new COB ID of the filtered type is added
+        Then the next filter should include the new message
+        """
+        types = [MessageType.HEARTBEAT]
+        self.assertEqual(self.table.count(types), 2)
+        self.table += make_message(0x710)
+        messages = self.table.filter(types)
+        self.assertEqual([m.arb_id for m in messages], [0x701, 0x710, 0x721])
+
+    def test_filter_updated_message(self):
+        """Given a table that has already been filtered
+        When a message with an existing COB ID is added
+        Then the next filter should return the newer message
+        """
+        types = [MessageType.HEARTBEAT]
+        self.table.filter(types)
+        update = make_message(0x701, [5])
+        self.table += update
+        self.assertIs(self.table.filter(types)[0], update)
+
+    def test_call_slice(self):
+        """Given a table with 4 messages
+        When calling the table with a start and stop position
+        Then the messages in that range should be returned, sorted by COB ID
+        """
+        messages = self.table(1, 3)
+        self.assertEqual([m.arb_id for m in messages], [0x581, 0x701])
+
+    def test_iter_sorted(self):
+        """Given a table with 4 messages
+        When iterating over the table
+        Then every message should be returned, sorted by COB ID
+        """
+        self.assertEqual([m.arb_id for m in self.table],
+                         [0x181, 0x581, 0x701, 0x721])
+
+    def test_filter_overlapping_types(self):
+        """Given a table with PDO messages
+        When filtering by both a PDO type and the PDO supertype
+        Then each matching message should only be returned once
+        """
+        messages = self.table.filter([MessageType.PDO1_TX, MessageType.PDO])
+        self.assertEqual([m.arb_id for m in messages], [0x181])